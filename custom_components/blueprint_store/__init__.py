@@ -18,7 +18,8 @@ from .const import (
     DATA_DIRNAME,
     DB_FILENAME,
 )
-from .db import async_init_db, async_refresh_if_due
+from .coordinator import BlueprintStoreCoordinator
+from .db import DbWriter, async_init_db
 
 try:
     from .api import register_api_views  # (hass, db_path) -> None
@@ -37,6 +38,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     db_path = str(data_dir / DB_FILENAME)
     await async_init_db(hass, db_path)
 
+    # Single writer thread: all upsert/meta/index writes are queued and group-committed
+    writer = DbWriter(db_path)
+    writer.start()
+
     # 2) Static mounts
     #    - /blueprint_store_static -> panel dir (index.html, app.js, css)
     #    - /blueprint_store_static/images -> images dir (outside panel)
@@ -76,6 +81,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # 4) Keep state for unload
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["db_path"] = db_path
+    hass.data[DOMAIN]["writer"] = writer
     hass.data[DOMAIN]["panel_registered"] = True
 
     # 5) API views (if present)
@@ -85,11 +91,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as e:
             _LOGGER.exception("Failed to register Blueprint Store API views: %s", e)
 
-    # 6) Non-fatal refresh gate
+    # 6) Coordinator: refresh gate, similar-blueprints stage, writer health.
+    #    DataUpdateCoordinator only schedules ticks while it has listeners.
+    coordinator = BlueprintStoreCoordinator(hass, db_path)
+    hass.data[DOMAIN]["coordinator"] = coordinator
+    entry.async_on_unload(coordinator.async_add_listener(lambda: None))
     try:
-        await async_refresh_if_due(hass, db_path, force=False)
+        await coordinator.async_refresh()
     except Exception as e:
-        _LOGGER.debug("Refresh gate check failed (non-fatal): %s", e)
+        _LOGGER.debug("Initial coordinator refresh failed (non-fatal): %s", e)
 
     return True
 
@@ -102,5 +112,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as e:
         _LOGGER.debug("Panel removal warning: %s", e)
 
+    writer = hass.data.get(DOMAIN, {}).get("writer")
+    if writer is not None:
+        await hass.async_add_executor_job(writer.stop)
+
     hass.data.pop(DOMAIN, None)
     return True
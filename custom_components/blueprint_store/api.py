@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, API_BP_TOPIC, API_CHANGES, QP_SINCE, QP_AFTER, QP_LIMIT
+from . import db as dbmod
+
+
+class BlueprintTopicView(HomeAssistantView):
+    """Single topic detail plus its precomputed "similar blueprints" list."""
+
+    url = API_BP_TOPIC + r"/{topic_id:\d+}"
+    name = f"api:{DOMAIN}:topic"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant, db_path: str) -> None:
+        self.hass = hass
+        self.db_path = db_path
+
+    async def get(self, request, topic_id: str):
+        item = await dbmod.async_get_topic(self.hass, self.db_path, int(topic_id))
+        if item is None:
+            return self.json({"error": "topic not found"}, status_code=404)
+        return self.json(item)
+
+
+class BlueprintChangesView(HomeAssistantView):
+    """Rows changed since a (row_version, id) cursor, plus tombstones for pruned topics."""
+
+    url = API_CHANGES
+    name = f"api:{DOMAIN}:changes"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant, db_path: str) -> None:
+        self.hass = hass
+        self.db_path = db_path
+
+    async def get(self, request):
+        try:
+            since = max(int(request.query.get(QP_SINCE, 0)), 0)
+            after = max(int(request.query.get(QP_AFTER, 0)), 0)
+            limit = min(max(int(request.query.get(QP_LIMIT, 500)), 1), 2000)
+        except ValueError:
+            return self.json({"error": "invalid cursor"}, status_code=400)
+        data = await dbmod.async_changes_since(
+            self.hass, self.db_path, since=since, after=after, limit=limit
+        )
+        return self.json(data)
+
+
+def register_api_views(hass: HomeAssistant, db_path: str) -> None:
+    hass.http.register_view(BlueprintTopicView(hass, db_path))
+    hass.http.register_view(BlueprintChangesView(hass, db_path))
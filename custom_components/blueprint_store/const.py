@@ -4,6 +4,7 @@ DOMAIN = "blueprint_store"
 DATA_DIRNAME = "blueprint_store"
 DATA_COORDINATOR = f"{DOMAIN}_coordinator"
 DATA_LOADED = f"{DOMAIN}_loaded"
+DB_FILENAME = "blueprint_store.db"
 # ---- Sidebar panel (frontend) ----
 # URL slug that appears in the sidebar (e.g., /blueprint_store)
 PANEL_URL_PATH = "blueprint_store"
@@ -28,6 +29,7 @@ API_BP_LIST = f"{API_BASE}/blueprints"
 API_BP_TOPIC = f"{API_BASE}/topic"
 API_FILTERS = f"{API_BASE}/filters"
 API_REDIRECT = f"{API_BASE}/go"
+API_CHANGES = f"{API_BASE}/changes" # delta sync for the panel's local copy
 # ---- Config Flow / Options ----
 # Keys
 CONF_SCAN_INTERVAL_MIN = "scan_interval_min"
@@ -41,6 +43,7 @@ DEFAULT_MAX_PAGES = 4 # how many forum pages to crawl per refresh
 DEFAULT_CACHE_TTL_MIN = 30 # in-memory cache TTL (minutes)
 DEFAULT_ENABLE_SPOTLIGHT = True # show Creator Spotlight section
 DEFAULT_SORT_DEFAULT = "new" # initial sort mode
+REFRESH_INTERVAL_SECS = DEFAULT_SCAN_INTERVAL_MIN * 60 # coordinator tick / refresh gate
 # Some flows expect a mapping they can import directly.
 DEFAULT_OPTIONS = {
     CONF_SCAN_INTERVAL_MIN: DEFAULT_SCAN_INTERVAL_MIN,
@@ -75,6 +78,9 @@ QP_Q_TITLE = "q_title"
 QP_Q_TEXT = "q_text"
 QP_SORT = "sort"
 QP_BUCKET = "bucket"
+QP_SINCE = "since" # delta sync cursor: row version...
+QP_AFTER = "after" # ...and last topic id seen at that version
+QP_LIMIT = "limit"
 # Retry/backoff defaults for forum requests (UI may show 429s otherwise)
 HTTP_RETRY_BASE_MS = 600
 HTTP_RETRY_MAX_TRIES = 3
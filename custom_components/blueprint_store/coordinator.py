@@ -37,8 +37,10 @@ class BlueprintStoreCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         Actual scraping/upserting is performed elsewhere (API view / task),
         so this coordinator only handles gating and health.
         """
-        # Ensure the DB schema exists
-        await self.hass.async_add_executor_job(dbmod.ensure_db, self.db_path)
+        # Ensure the DB schema exists (the writer thread does this itself when running)
+        writer = dbmod.get_writer(self.hass, self.db_path)
+        if writer is None:
+            await self.hass.async_add_executor_job(dbmod.ensure_db, self.db_path)
 
         # Handle possible stale module cache gracefully
         try:
@@ -57,5 +59,21 @@ class BlueprintStoreCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 DOMAIN,
             )
 
-        # Return an empty payload; consumers query the DB directly via your views
-        return {}
+        # Similar-blueprints stage: a no-op unless a refresh actually wrote posts since
+        # the last pass; then only changed topics (plus LSH neighbours) are re-indexed.
+        try:
+            reindexed = await dbmod.async_rebuild_similar(self.hass, self.db_path)
+            if reindexed:
+                _LOGGER.debug("Similar-blueprints index updated for %d topics", reindexed)
+        except Exception as e:
+            _LOGGER.debug("Similar-blueprints index update failed (non-fatal): %s", e)
+
+        # Consumers query the DB directly via your views; expose writer health only
+        if writer is None:
+            return {}
+        stats = writer.stats()
+        _LOGGER.debug(
+            "DB writer: queue depth %d, %d commits, last %.1f ms, max %.1f ms",
+            stats["queue_depth"], stats["commits"], stats["last_commit_ms"], stats["max_commit_ms"],
+        )
+        return {"writer": stats}
@@ -1,11 +1,21 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import operator
+import queue
+import random
 import re
 import sqlite3
+import threading
 import time
+import zlib
+from array import array
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Iterable, List, Dict, Any, Optional, Tuple
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple
 
 try:
     # Available once HA loads the integration fully
@@ -13,6 +23,13 @@ try:
 except Exception:
     REFRESH_INTERVAL_SECS = 30 * 60  # fallback
 
+try:
+    from .const import DOMAIN
+except Exception:
+    DOMAIN = "blueprint_store"  # fallback
+
+_LOGGER = logging.getLogger(__name__)
+
 PRAGMAS = [
     ("journal_mode", "WAL"),
     ("synchronous", "NORMAL"),
@@ -21,6 +38,22 @@ PRAGMAS = [
     ("mmap_size", str(64 * 1024 * 1024)),
 ]
 
+# "Similar blueprints" index (MinHash over title/tag/description features,
+# LSH banding for candidate lookup). BANDS must divide NUM_PERM.
+SIMILAR_TOP_K = 8
+SIMILAR_NUM_PERM = 64
+SIMILAR_BANDS = 32
+SIMILAR_MIN_SCORE = 0.15
+SIMILAR_DESC_WORDS = 200
+SIMILAR_MAX_BUCKET = 250  # bands shared by more topics than this are too generic to use
+SIMILAR_WRITE_CHUNK = 200  # rows per writer op, so index writes never hog a group commit
+
+# Single writer: queued writes are group-committed once a batch is full or the
+# oldest op has waited WRITER_MAX_DELAY seconds.
+WRITER_MAX_BATCH = 64
+WRITER_MAX_DELAY = 0.02
+WRITER_SLOW_COMMIT_MS = 1000
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS posts (
     id               INTEGER PRIMARY KEY,
@@ -37,13 +70,36 @@ CREATE TABLE IF NOT EXISTS posts (
     import_url       TEXT NOT NULL DEFAULT '',
     permalink        TEXT NOT NULL DEFAULT '',
     description      TEXT NOT NULL DEFAULT '',
-    has_multi_import INTEGER NOT NULL DEFAULT 0
+    has_multi_import INTEGER NOT NULL DEFAULT 0,
+    row_version      INTEGER NOT NULL DEFAULT 0
 );
 CREATE INDEX IF NOT EXISTS idx_posts_updated ON posts(updated_at DESC);
 CREATE INDEX IF NOT EXISTS idx_posts_likes   ON posts(likes DESC, views DESC);
 CREATE INDEX IF NOT EXISTS idx_posts_title   ON posts(title_norm);
 CREATE INDEX IF NOT EXISTS idx_posts_tags    ON posts(tags);
 
+-- Deleted (pruned) topics, so delta-syncing clients can drop them locally.
+-- A prune must stamp these via _next_row_version; none exists yet.
+CREATE TABLE IF NOT EXISTS tombstones (
+    id          INTEGER PRIMARY KEY,
+    row_version INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tombstones_version ON tombstones(row_version);
+
+CREATE TABLE IF NOT EXISTS post_minhash (
+    id        INTEGER PRIMARY KEY,
+    text_hash TEXT NOT NULL,
+    sig       BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS post_similar (
+    id         INTEGER NOT NULL,
+    rank       INTEGER NOT NULL,
+    similar_id INTEGER NOT NULL,
+    score      REAL NOT NULL,
+    PRIMARY KEY (id, rank)
+);
+
 CREATE TABLE IF NOT EXISTS meta (
     key   TEXT PRIMARY KEY,
     value TEXT
@@ -62,10 +118,17 @@ def _open(db_path: str) -> sqlite3.Connection:
     conn.commit()
     return conn
 
+def _migrate(conn: sqlite3.Connection) -> None:
+    cols = {r["name"] for r in conn.execute("PRAGMA table_info(posts)")}
+    if "row_version" not in cols:
+        conn.execute("ALTER TABLE posts ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_version ON posts(row_version, id)")
+
 def ensure_db(db_path: str) -> None:
     conn = _open(db_path)
     try:
         conn.executescript(SCHEMA)
+        _migrate(conn)
         conn.commit()
     finally:
         conn.close()
@@ -83,9 +146,22 @@ def _norm(s: str) -> str:
     s = re.sub(r"\s+", " ", s)
     return s.lower()
 
-def upsert_posts(conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]]) -> int:
+def _next_row_version(cur: sqlite3.Cursor) -> int:
+    """Next monotonically increasing row version; call inside the write transaction and
+    store it in meta only if a row actually got stamped with it."""
+    cur.execute("SELECT value FROM meta WHERE key='row_version'")
+    row = cur.fetchone()
+    return (int(row[0]) if row else 0) + 1
+
+def upsert_posts(conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]], *,
+                 commit: bool = True) -> int:
     cur = conn.cursor()
+    # Take the write lock before reading the version counter so versions commit in order
+    if not conn.in_transaction:
+        cur.execute("BEGIN IMMEDIATE")
+    version = _next_row_version(cur)
     n = 0
+    stamped = 0
     for p in posts:
         tags_val = p.get("tags", [])
         if isinstance(tags_val, (list, tuple)):
@@ -95,9 +171,11 @@ def upsert_posts(conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]]) -> i
         cur.execute(
             """
             INSERT INTO posts (id,title,title_norm,author,likes,views,replies,tags,category,
-                               created_at,updated_at,import_url,permalink,description,has_multi_import)
+                               created_at,updated_at,import_url,permalink,description,has_multi_import,
+                               row_version)
             VALUES (:id,:title,:title_norm,:author,:likes,:views,:replies,:tags,:category,
-                    :created_at,:updated_at,:import_url,:permalink,:description,:has_multi_import)
+                    :created_at,:updated_at,:import_url,:permalink,:description,:has_multi_import,
+                    :row_version)
             ON CONFLICT(id) DO UPDATE SET
                 title=excluded.title,
                 title_norm=excluded.title_norm,
@@ -112,7 +190,21 @@ def upsert_posts(conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]]) -> i
                 import_url=excluded.import_url,
                 permalink=excluded.permalink,
                 description=excluded.description,
-                has_multi_import=excluded.has_multi_import
+                has_multi_import=excluded.has_multi_import,
+                row_version=excluded.row_version
+            WHERE posts.title IS NOT excluded.title
+               OR posts.author IS NOT excluded.author
+               OR posts.likes IS NOT excluded.likes
+               OR posts.views IS NOT excluded.views
+               OR posts.replies IS NOT excluded.replies
+               OR posts.tags IS NOT excluded.tags
+               OR posts.category IS NOT excluded.category
+               OR posts.created_at IS NOT excluded.created_at
+               OR posts.updated_at IS NOT excluded.updated_at
+               OR posts.import_url IS NOT excluded.import_url
+               OR posts.permalink IS NOT excluded.permalink
+               OR posts.description IS NOT excluded.description
+               OR posts.has_multi_import IS NOT excluded.has_multi_import
             """,
             {
                 "id": int(p["id"]),
@@ -130,18 +222,73 @@ def upsert_posts(conn: sqlite3.Connection, posts: Iterable[Dict[str, Any]]) -> i
                 "permalink": str(p.get("permalink", "")),
                 "description": str(p.get("description", "")),
                 "has_multi_import": 1 if p.get("has_multi_import") else 0,
+                "row_version": version,
             },
         )
+        # 0 when the ON CONFLICT ... WHERE found nothing to change
+        stamped += cur.rowcount
+        cur.execute("DELETE FROM tombstones WHERE id=?", (int(p["id"]),))
         n += 1
-    conn.commit()
+    if stamped:
+        _meta_set(conn, "row_version", str(version), commit=False)
+    if commit:
+        conn.commit()
     return n
 
 async def async_upsert_posts(hass, db_path: str, posts: Iterable[Dict[str, Any]]) -> int:
-    def _inner() -> int:
+    return await _async_write(hass, db_path, upsert_posts, list(posts))
+
+def changes_since(conn: sqlite3.Connection, *, since: int, after: int = 0,
+                  limit: int = 500) -> Dict[str, Any]:
+    """Rows changed after the (row_version, id) cursor plus tombstones in the same version range.
+
+    Tombstones are paged by version alongside the rows; the final page advances the cursor
+    past the newest tombstone.
+    """
+    since, after = int(since), int(after)
+    cur = conn.cursor()
+    cur.execute("BEGIN")  # one snapshot for rows + tombstones
+    try:
+        cur.execute(
+            """
+            SELECT id,title,author,likes,views,replies,tags,category,created_at,updated_at,
+                   import_url,permalink,description,has_multi_import,row_version
+            FROM posts
+            WHERE row_version > ? OR (row_version = ? AND id > ?)
+            ORDER BY row_version, id
+            LIMIT ?
+            """,
+            (since, since, after, int(limit) + 1),
+        )
+        items = [dict(r) for r in cur.fetchall()]
+        has_more = len(items) > limit
+        items = items[:limit]
+        if has_more:
+            cur.execute(
+                "SELECT id, row_version FROM tombstones WHERE row_version > ? AND row_version <= ?",
+                (since, items[-1]["row_version"]),
+            )
+        else:
+            cur.execute("SELECT id, row_version FROM tombstones WHERE row_version > ?", (since,))
+        tombs = cur.fetchall()
+    finally:
+        conn.rollback()
+
+    cursor = {"since": since, "after": after}
+    if items:
+        cursor = {"since": items[-1]["row_version"], "after": items[-1]["id"]}
+    if not has_more and tombs:
+        newest = max(r["row_version"] for r in tombs)
+        if newest > cursor["since"]:
+            cursor = {"since": newest, "after": 0}
+    deleted = sorted(r["id"] for r in tombs)
+    return {"items": items, "deleted": deleted, "cursor": cursor, "has_more": has_more}
+
+async def async_changes_since(hass, db_path: str, **kwargs) -> Dict[str, Any]:
+    def _inner() -> Dict[str, Any]:
         conn = _open(db_path)
         try:
-            ensure_db(db_path)
-            return upsert_posts(conn, posts)
+            return changes_since(conn, **kwargs)
         finally:
             conn.close()
     return await hass.async_add_executor_job(_inner)
@@ -193,6 +340,210 @@ async def async_query_posts(hass, db_path: str, **kwargs) -> List[Dict[str, Any]
             conn.close()
     return await hass.async_add_executor_job(_inner)
 
+# --------------- similar blueprints index ---------------
+
+_FEATURE_RE = re.compile(r"[a-z0-9]{3,}")
+_STOPWORDS = frozenset(
+    "the and for with this that you your are can not but all any from when will has have was "
+    "its use used using into then than also just only one more some other which there their "
+    "blueprint blueprints automation automations home assistant https http www com".split()
+)
+_MH_PRIME = (1 << 61) - 1
+_mh_rng = random.Random(0x5EED)  # fixed seed: stored signatures must stay comparable
+_MH_PERMS = [
+    (_mh_rng.randrange(1, _MH_PRIME), _mh_rng.randrange(0, _MH_PRIME))
+    for _ in range(SIMILAR_NUM_PERM)
+]
+
+def _features(title_norm: str, tags: str, description: str) -> set:
+    feats = set(_FEATURE_RE.findall(title_norm or ""))
+    feats.update(_FEATURE_RE.findall((description or "").lower())[:SIMILAR_DESC_WORDS])
+    feats -= _STOPWORDS
+    feats.update(f"#{t}" for t in (tags or "").split(",") if t)
+    return feats
+
+def _minhash(feats: set) -> bytes:
+    if not feats:
+        return b""
+    hs = [zlib.crc32(f.encode("utf-8")) for f in feats]
+    sig = array("I", (
+        min(((a * h + b) % _MH_PRIME) & 0xFFFFFFFF for h in hs)
+        for a, b in _MH_PERMS
+    ))
+    return sig.tobytes()
+
+def _bands(sig: bytes) -> List[Tuple[int, bytes]]:
+    if not sig:
+        return []
+    step = len(sig) // SIMILAR_BANDS
+    return [(i, sig[i * step:(i + 1) * step]) for i in range(SIMILAR_BANDS)]
+
+_SimilarPlan = Tuple[List[Tuple[int, str, bytes]], List[int], List[Tuple[int, List[Tuple[float, int]]]]]
+
+def _plan_similar(conn: sqlite3.Connection, top_k: int = SIMILAR_TOP_K) -> _SimilarPlan:
+    """Read-only half of the index stage: (minhash rows, removed ids, neighbour lists).
+
+    Only topics whose title/tags/description hash changed get a new signature; neighbour
+    lists are recomputed for those topics, for topics sharing an LSH band with their old
+    or new signature, and for topics that currently list a changed/removed topic.
+    """
+    cur = conn.cursor()
+    cur.execute("SELECT id, title_norm, tags, description FROM posts")
+    current: Dict[int, Tuple[str, sqlite3.Row]] = {}
+    for r in cur.fetchall():
+        blob = "\x1f".join((r["title_norm"], r["tags"], r["description"]))
+        current[r["id"]] = (hashlib.sha1(blob.encode("utf-8")).hexdigest(), r)
+    cur.execute("SELECT id, text_hash, sig FROM post_minhash")
+    stored = {r["id"]: (r["text_hash"], bytes(r["sig"])) for r in cur.fetchall()}
+
+    changed = [i for i, (h, _) in current.items() if i not in stored or stored[i][0] != h]
+    removed = [i for i in stored if i not in current]
+    if not changed and not removed:
+        return [], [], []
+
+    old_sigs = [stored[i][1] for i in changed + removed if i in stored]
+    sigs = {i: sig for i, (_, sig) in stored.items() if i in current}
+    minhash_rows: List[Tuple[int, str, bytes]] = []
+    for i in changed:
+        h, r = current[i]
+        sigs[i] = _minhash(_features(r["title_norm"], r["tags"], r["description"]))
+        minhash_rows.append((i, h, sigs[i]))
+
+    buckets: Dict[Tuple[int, bytes], List[int]] = {}
+    for i, sig in sigs.items():
+        for key in _bands(sig):
+            buckets.setdefault(key, []).append(i)
+    buckets = {k: v for k, v in buckets.items() if 1 < len(v) <= SIMILAR_MAX_BUCKET}
+
+    touched = set(changed) | set(removed)
+    dirty = set(changed)
+    for sig in [sigs[i] for i in changed] + old_sigs:
+        for key in _bands(sig):
+            dirty.update(buckets.get(key, ()))
+    cur.execute("SELECT id, similar_id FROM post_similar")
+    dirty.update(r["id"] for r in cur.fetchall() if r["similar_id"] in touched)
+    dirty.intersection_update(current)
+
+    vecs: Dict[int, array] = {}
+    def _vec(i: int) -> array:
+        v = vecs.get(i)
+        if v is None:
+            v = vecs[i] = array("I")
+            v.frombytes(sigs[i])
+        return v
+
+    neighbours: List[Tuple[int, List[Tuple[float, int]]]] = []
+    for i in dirty:
+        scored: List[Tuple[float, int]] = []
+        if sigs[i]:
+            cand = set()
+            for key in _bands(sigs[i]):
+                cand.update(buckets.get(key, ()))
+            cand.discard(i)
+            mine = _vec(i)
+            for j in cand:
+                score = sum(map(operator.eq, mine, _vec(j))) / len(mine)
+                if score >= SIMILAR_MIN_SCORE:
+                    scored.append((score, j))
+            scored.sort(key=lambda t: (-t[0], t[1]))
+        neighbours.append((i, scored[:top_k]))
+    return minhash_rows, removed, neighbours
+
+def _write_similar(conn: sqlite3.Connection, minhash_rows: List[Tuple[int, str, bytes]],
+                   removed: List[int], neighbours: List[Tuple[int, List[Tuple[float, int]]]],
+                   *, commit: bool = True) -> None:
+    cur = conn.cursor()
+    cur.executemany(
+        "INSERT INTO post_minhash(id,text_hash,sig) VALUES(?,?,?) "
+        "ON CONFLICT(id) DO UPDATE SET text_hash=excluded.text_hash, sig=excluded.sig",
+        minhash_rows,
+    )
+    for i in removed:
+        cur.execute("DELETE FROM post_minhash WHERE id=?", (i,))
+        cur.execute("DELETE FROM post_similar WHERE id=?", (i,))
+    for i, scored in neighbours:
+        cur.execute("DELETE FROM post_similar WHERE id=?", (i,))
+        cur.executemany(
+            "INSERT INTO post_similar(id,rank,similar_id,score) VALUES(?,?,?,?)",
+            [(i, rank, j, round(score, 4)) for rank, (score, j) in enumerate(scored)],
+        )
+    if commit:
+        conn.commit()
+
+def rebuild_similar(conn: sqlite3.Connection, *, top_k: int = SIMILAR_TOP_K,
+                    commit: bool = True) -> int:
+    """Incrementally refresh the top-k neighbour table. Returns the number of topics recomputed."""
+    minhash_rows, removed, neighbours = _plan_similar(conn, top_k)
+    _write_similar(conn, minhash_rows, removed, neighbours, commit=commit)
+    return len(neighbours)
+
+async def async_rebuild_similar(hass, db_path: str) -> int:
+    """Run the index stage if posts changed since the last pass (row_version moved).
+
+    Compute on a plain read connection in the executor; only the row writes go through
+    the writer, in SIMILAR_WRITE_CHUNK slices so queued crawl writes interleave.
+    Signatures are written last: if a chunk fails midway, the stored text hashes still
+    differ from the posts, so the next pass plans the same topics again.
+    """
+    def _plan() -> Optional[Tuple[str, _SimilarPlan]]:
+        ensure_db(db_path)
+        conn = _open(db_path)
+        try:
+            version = _meta_get(conn, "row_version") or "0"
+            if _meta_get(conn, "similar_version") == version:
+                return None
+            return version, _plan_similar(conn)
+        finally:
+            conn.close()
+    planned = await hass.async_add_executor_job(_plan)
+    if planned is None:
+        return 0
+    version, (minhash_rows, removed, neighbours) = planned
+    n = SIMILAR_WRITE_CHUNK
+    for k in range(0, len(neighbours), n):
+        await _async_write(hass, db_path, _write_similar, [], [], neighbours[k:k + n])
+    for k in range(0, len(removed), n):
+        await _async_write(hass, db_path, _write_similar, [], removed[k:k + n], [])
+    for k in range(0, len(minhash_rows), n):
+        await _async_write(hass, db_path, _write_similar, minhash_rows[k:k + n], [], [])
+    await _async_write(hass, db_path, _meta_set, "similar_version", version)
+    return len(neighbours)
+
+def get_topic(conn: sqlite3.Connection, topic_id: int) -> Optional[Dict[str, Any]]:
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT id,title,author,likes,views,replies,tags,category,created_at,updated_at,
+               import_url,permalink,description,has_multi_import
+        FROM posts WHERE id=?
+        """,
+        (int(topic_id),),
+    )
+    row = cur.fetchone()
+    if row is None:
+        return None
+    cur.execute(
+        """
+        SELECT p.id,p.title,p.author,p.likes,p.views,p.tags,p.import_url,p.permalink,s.score
+        FROM post_similar s JOIN posts p ON p.id = s.similar_id
+        WHERE s.id=?
+        ORDER BY s.rank
+        """,
+        (int(topic_id),),
+    )
+    out = dict(row)
+    out["similar"] = [dict(r) for r in cur.fetchall()]
+    return out
+
+async def async_get_topic(hass, db_path: str, topic_id: int) -> Optional[Dict[str, Any]]:
+    def _inner() -> Optional[Dict[str, Any]]:
+        conn = _open(db_path)
+        try:
+            return get_topic(conn, topic_id)
+        finally:
+            conn.close()
+    return await hass.async_add_executor_job(_inner)
+
 # --------------- spotlight & meta ---------------
 
 def get_spotlight(conn: sqlite3.Connection) -> Dict[str, Any]:
@@ -226,27 +577,216 @@ def _meta_get(conn: sqlite3.Connection, key: str) -> Optional[str]:
     row = cur.fetchone()
     return None if row is None else row[0]
 
-def _meta_set(conn: sqlite3.Connection, key: str, value: str) -> None:
+def _meta_set(conn: sqlite3.Connection, key: str, value: str, *, commit: bool = True) -> None:
     cur = conn.cursor()
     cur.execute(
         "INSERT INTO meta(key,value) VALUES(?,?) "
         "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
         (key, value),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
+
+async def async_meta_set(hass, db_path: str, key: str, value: str) -> None:
+    await _async_write(hass, db_path, _meta_set, key, value)
+
+def _refresh_gate(conn: sqlite3.Connection, force: bool, *, commit: bool = True) -> bool:
+    now = int(time.time())
+    last = _meta_get(conn, "last_refresh_ts")
+    if force or last is None or (now - int(last)) >= int(REFRESH_INTERVAL_SECS):
+        _meta_set(conn, "last_refresh_ts", str(now), commit=commit)
+        return True
+    return False
 
 async def async_refresh_if_due(hass, db_path: str, *, force: bool = False) -> bool:
     """Gate refreshes to at most every REFRESH_INTERVAL_SECS. Returns True when refresh is due."""
-    def _inner() -> bool:
+    return await _async_write(hass, db_path, _refresh_gate, force)
+
+# --------------- single writer ---------------
+
+_STOP = object()
+
+class DbWriter:
+    """Dedicated thread owning the only write connection.
+
+    Callers submit `fn(conn, *args, commit=False, **kwargs)` and get a Future back.
+    Queued ops are coalesced into one transaction (each inside its own SAVEPOINT, so
+    a failing op doesn't take the batch down) and committed together; readers on
+    WAL connections never wait on this thread.
+    """
+
+    def __init__(self, db_path: str, *, max_batch: int = WRITER_MAX_BATCH,
+                 max_delay: float = WRITER_MAX_DELAY) -> None:
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._commits = 0
+        self._ops = 0
+        self._failed = 0
+        self._last_batch = 0
+        self._last_commit_ms = 0.0
+        self._max_commit_ms = 0.0
+        self._total_commit_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"{DOMAIN}_db_writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0) -> bool:
+        """Flush queued ops and stop the thread (blocking; run in an executor).
+
+        Returns False if the thread is still busy after `timeout` seconds.
+        """
+        with self._lock:
+            if self._running:
+                self._running = False
+                self._queue.put(_STOP)
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            _LOGGER.warning("Blueprint Store database writer still busy after %.0fs; "
+                            "it will exit once the current commit finishes", timeout)
+            return False
+        return True
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        fut: Future = Future()
+        kwargs.setdefault("commit", False)
+        # Check-and-put under the lock so nothing lands in the queue after the final drain
+        with self._lock:
+            if self._running:
+                self._queue.put((fut, fn, args, kwargs))
+                return fut
+        fut.set_exception(RuntimeError("database writer is not running"))
+        return fut
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "commits": self._commits,
+                "ops": self._ops,
+                "failed_ops": self._failed,
+                "last_batch": self._last_batch,
+                "last_commit_ms": round(self._last_commit_ms, 2),
+                "avg_commit_ms": round(self._total_commit_ms / self._commits, 2) if self._commits else 0.0,
+                "max_commit_ms": round(self._max_commit_ms, 2),
+            }
+
+    def _run(self) -> None:
+        conn = _open(self.db_path)
+        try:
+            conn.executescript(SCHEMA)
+            _migrate(conn)
+            conn.commit()
+            stopping = False
+            while not stopping:
+                item = self._queue.get()
+                batch = []
+                deadline = time.monotonic() + self.max_delay
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    remaining = deadline - time.monotonic()
+                    if len(batch) >= self.max_batch or remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._commit(conn, batch)
+        except Exception:
+            _LOGGER.exception("Blueprint Store database writer stopped unexpectedly")
+        finally:
+            conn.close()
+            with self._lock:
+                self._running = False
+                leftover = []
+                while True:
+                    try:
+                        leftover.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+            for item in leftover:
+                if item is not _STOP and not item[0].done():
+                    item[0].set_exception(RuntimeError("database writer stopped"))
+
+    def _commit(self, conn: sqlite3.Connection, batch: List[Tuple[Future, Callable[..., Any], tuple, dict]]) -> None:
+        started = time.monotonic()
+        done: List[Tuple[Future, Any]] = []
+        failed = 0
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fut, fn, args, kwargs in batch:
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                conn.execute("SAVEPOINT op")
+                try:
+                    result = fn(conn, *args, **kwargs)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO op")
+                    conn.execute("RELEASE op")
+                    fut.set_exception(e)
+                    failed += 1
+                    continue
+                conn.execute("RELEASE op")
+                done.append((fut, result))
+            conn.commit()
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            for fut, _fn, _args, _kwargs in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            failed = len(batch)
+            done = []
+        for fut, result in done:
+            fut.set_result(result)
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            self._commits += 1
+            self._ops += len(batch)
+            self._failed += failed
+            self._last_batch = len(batch)
+            self._last_commit_ms = elapsed_ms
+            self._max_commit_ms = max(self._max_commit_ms, elapsed_ms)
+            self._total_commit_ms += elapsed_ms
+        if elapsed_ms >= WRITER_SLOW_COMMIT_MS:
+            _LOGGER.debug("Slow group commit: %d ops in %.0f ms (queue depth %d)",
+                          len(batch), elapsed_ms, self._queue.qsize())
+
+def get_writer(hass, db_path: Optional[str] = None) -> Optional[DbWriter]:
+    writer = (hass.data.get(DOMAIN) or {}).get("writer")
+    if writer is None or not writer.running or (db_path and writer.db_path != db_path):
+        return None
+    return writer
+
+async def _async_write(hass, db_path: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Route a write through the running DbWriter, or run it directly before setup/after unload."""
+    writer = get_writer(hass, db_path)
+    if writer is not None:
+        return await asyncio.wrap_future(writer.submit(fn, *args, **kwargs))
+    def _inner() -> Any:
         ensure_db(db_path)
         conn = _open(db_path)
         try:
-            now = int(time.time())
-            last = _meta_get(conn, "last_refresh_ts")
-            if force or last is None or (now - int(last)) >= int(REFRESH_INTERVAL_SECS):
-                _meta_set(conn, "last_refresh_ts", str(now))
-                return True
-            return False
+            return fn(conn, *args, **kwargs)
         finally:
             conn.close()
     return await hass.async_add_executor_job(_inner)
@@ -256,6 +796,12 @@ __all__ = [
     "async_refresh_if_due",
     "async_upsert_posts",
     "async_query_posts",
+    "async_changes_since",
     "async_get_spotlight",
+    "async_rebuild_similar",
+    "async_get_topic",
+    "async_meta_set",
+    "DbWriter",
+    "get_writer",
     "ensure_db",
 ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from . import db as dbmod
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Diagnostics download: database writer health (queue depth, commit latency)."""
+    data = hass.data.get(DOMAIN, {})
+    writer = dbmod.get_writer(hass, data.get("db_path"))
+    return {
+        "db_path": data.get("db_path"),
+        "writer": writer.stats() if writer is not None else None,
+    }
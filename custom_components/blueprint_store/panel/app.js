@@ -71,6 +71,14 @@ let q        = "";
 let bucket   = "";         // tag filter (empty = all)
 let sort     = "likes";    // "likes" | "new" | "title"
 
+/* local catalog: set once the IndexedDB copy is usable; null = server paging */
+let catalog    = null;       // Map<id, item>
+let localDb    = null;
+let syncCursor = { since: 0, after: 0 };
+let view       = [];         // filtered + sorted catalog
+let viewPos    = 0;
+const VIEW_CHUNK = 30;
+
 /* ---------- stable title cleanup (used only for sort-title) ---------- */
 function cleanTitle(s = "") {
   const t = s.trim().replace(/^\p{Emoji_Presentation}|\p{Extended_Pictographic}/gu, "").trim();
@@ -140,6 +148,86 @@ async function fetchPage(pageNum) {
   return fetchJSON(`${API}?${params.toString()}`);
 }
 
+/* ---------- local catalog (IndexedDB) + delta sync ----------
+   The backend stamps every changed row with a row version; /changes returns
+   rows past our cursor plus ids of pruned topics, so reopening the panel
+   only moves what changed since the last visit.
+------------------------------------------------- */
+const IDB_NAME    = "blueprint_store";
+const IDB_VERSION = 1;
+
+function idbReq(r) {
+  return new Promise((res, rej) => { r.onsuccess = () => res(r.result); r.onerror = () => rej(r.error); });
+}
+
+function idbDone(tx) {
+  return new Promise((res, rej) => {
+    tx.oncomplete = () => res();
+    tx.onerror = tx.onabort = () => rej(tx.error);
+  });
+}
+
+function idbOpen() {
+  if (!window.indexedDB) return Promise.reject(new Error("IndexedDB unavailable"));
+  const req = indexedDB.open(IDB_NAME, IDB_VERSION);
+  req.onupgradeneeded = () => {
+    const db = req.result;
+    if (!db.objectStoreNames.contains("posts")) db.createObjectStore("posts", { keyPath: "id" });
+    if (!db.objectStoreNames.contains("meta"))  db.createObjectStore("meta");
+  };
+  return idbReq(req);
+}
+
+async function idbLoad(db) {
+  const tx = db.transaction(["posts", "meta"], "readonly");
+  const [rows, cursor] = await Promise.all([
+    idbReq(tx.objectStore("posts").getAll()),
+    idbReq(tx.objectStore("meta").get("cursor")),
+  ]);
+  return { rows: rows || [], cursor: cursor || { since: 0, after: 0 } };
+}
+
+function idbApply(db, items, deleted, cursor) {
+  const tx = db.transaction(["posts", "meta"], "readwrite");
+  const posts = tx.objectStore("posts");
+  for (const it of items)   posts.put(it);
+  for (const id of deleted) posts.delete(id);
+  tx.objectStore("meta").put(cursor, "cursor");
+  return idbDone(tx);
+}
+
+// DB rows -> the item shape the rest of this file expects
+function fromRow(row) {
+  const iso = (v) => (typeof v === "number" ? new Date(v * 1000).toISOString() : v);
+  return {
+    ...row,
+    tags: String(row.tags || "").split(",").filter(Boolean),
+    excerpt: row.description || "",
+    created_at: iso(row.created_at),
+    updated_at: iso(row.updated_at),
+  };
+}
+
+async function syncCatalog(onPage) {
+  let changed = 0;
+  for (;;) {
+    const params = new URLSearchParams({
+      since: String(syncCursor.since), after: String(syncCursor.after),
+    });
+    const data    = await fetchJSON(`${API}/changes?${params.toString()}`);
+    const items   = (data.items || []).map(fromRow);
+    const deleted = data.deleted || [];
+    const cursor  = data.cursor || syncCursor;
+    await idbApply(localDb, items, deleted, cursor);
+    for (const it of items)   catalog.set(it.id, it);
+    changed += items.length;
+    for (const id of deleted) if (catalog.delete(id)) changed++;
+    syncCursor = cursor;
+    if (!data.has_more) return changed;
+    if (onPage) onPage();
+  }
+}
+
 /* ---------- creators footer hooks (no layout change) ---------- */
 function footerSpin(on) {
   if (!creatorsSpin) return;
@@ -207,9 +295,39 @@ if (typeof window.makeCard !== "function") {
   };
 }
 
+/* ---------- local render: sort/filter the catalog in memory ---------- */
+function renderLocal(initial) {
+  if (initial) {
+    const tokens = tokenize(q);
+    let out = Array.from(catalog.values()).filter(it => matchesBucket(it, bucket));
+    if (tokens.length) {
+      out.forEach(it => it._score = scoreItem(it, tokens));
+      out = out.filter(it => it._score > 0);
+    }
+    out.sort(sorterFor(sort, tokens.length > 0));
+    view = out;
+    viewPos = 0;
+
+    if (list)  list.innerHTML = "";
+    if (empty) empty.style.display = view.length ? "none" : "block";
+
+    footerSpin(true);
+    renderCreatorsFooter(computeCreatorStats(catalog.values()));
+    footerSpin(false);
+  }
+
+  for (const it of view.slice(viewPos, viewPos + VIEW_CHUNK)) {
+    const card = window.makeCard(it);
+    if (list && card) list.appendChild(card);
+  }
+  viewPos = Math.min(viewPos + VIEW_CHUNK, view.length);
+  hasMore = viewPos < view.length;
+}
+
 /* ---------- core load() with hardened search & filters ---------- */
 async function load(initial = false) {
   if (loading || (!hasMore && !initial)) return;
+  if (catalog) { renderLocal(initial); return; }
   loading = true;
   if (errorBox) errorBox.style.display = "none";
 
@@ -304,7 +422,11 @@ if (tagBtn) {
 }
 
 if (refresh) {
-  refresh.addEventListener("click", () => {
+  refresh.addEventListener("click", async () => {
+    if (localDb) {
+      try { await syncCatalog(); }
+      catch (e) { /* keep showing the local copy */ }
+    }
     resetAndLoad();
   });
 }
@@ -319,5 +441,37 @@ if (sentinel) {
   io.observe(sentinel);
 }
 
-// Initial load
-resetAndLoad();
+// Initial load: paint the local copy right away, then pull only the deltas.
+// Without IndexedDB (or /changes) we fall back to plain server paging.
+async function boot() {
+  try {
+    localDb = await idbOpen();
+    const { rows, cursor } = await idbLoad(localDb);
+    catalog = new Map(rows.map(r => [r.id, r]));
+    syncCursor = cursor;
+    if (catalog.size) resetAndLoad();
+  } catch (e) {
+    localDb = null;
+    catalog = null;
+    resetAndLoad();
+    return;
+  }
+  try {
+    // First visit: draw as soon as the first page lands instead of after the whole catalog
+    let painted = catalog.size > 0;
+    const changed = await syncCatalog(() => {
+      if (!painted && catalog.size) { painted = true; resetAndLoad(); }
+    });
+    if (changed || !catalog.size) resetAndLoad();
+  } catch (e) {
+    // Show whatever we have (possibly a partially applied first sync);
+    // fall back to server paging only when there is nothing local at all.
+    if (!catalog.size) {
+      localDb = null;
+      catalog = null;
+    }
+    resetAndLoad();
+  }
+}
+
+boot();
@@ -0,0 +1,109 @@
+"""Tests for the SQLite layer (custom_components/blueprint_store/db.py)."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+COMPONENT_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "blueprint_store"
+
+
+@pytest.fixture(scope="module")
+def db():
+    # Load db.py (and its .const import) without running the package __init__,
+    # which needs a full Home Assistant install.
+    pkg = types.ModuleType("blueprint_store")
+    pkg.__path__ = [str(COMPONENT_DIR)]
+    sys.modules.setdefault("blueprint_store", pkg)
+    return importlib.import_module("blueprint_store.db")
+
+
+class _Hass:
+    """Just enough of HomeAssistant for the db async helpers."""
+
+    def __init__(self) -> None:
+        self.data = {}
+
+    async def async_add_executor_job(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+
+def _posts(n):
+    return [
+        {
+            "id": i,
+            "title": f"Motion activated light {i % 3}",
+            "tags": ["lighting", "motion"],
+            "description": "turn on lights when zigbee motion sensor detects presence",
+            "created_at": 1,
+            "updated_at": 1,
+        }
+        for i in range(n)
+    ]
+
+
+def test_interrupted_similar_build_is_repaired(db, tmp_path, monkeypatch):
+    path = str(tmp_path / "bps.db")
+    db.ensure_db(path)
+    hass = _Hass()
+    monkeypatch.setattr(db, "SIMILAR_WRITE_CHUNK", 3)
+
+    real_write = db._write_similar
+    failed = []
+
+    def flaky_write(conn, minhash_rows, removed, neighbours, **kwargs):
+        # Stop the build at the first neighbour chunk, as an unload mid-build would
+        if neighbours and not failed:
+            failed.append(True)
+            raise RuntimeError("writer stopped")
+        return real_write(conn, minhash_rows, removed, neighbours, **kwargs)
+
+    async def run():
+        await db.async_upsert_posts(hass, path, _posts(10))
+        monkeypatch.setattr(db, "_write_similar", flaky_write)
+        with pytest.raises(RuntimeError):
+            await db.async_rebuild_similar(hass, path)
+        monkeypatch.setattr(db, "_write_similar", real_write)
+        first = await db.async_rebuild_similar(hass, path)
+        second = await db.async_rebuild_similar(hass, path)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == 10
+    assert second == 0
+
+    conn = db._open(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM post_minhash").fetchone()[0] == 10
+        assert conn.execute("SELECT COUNT(DISTINCT id) FROM post_similar").fetchone()[0] == 10
+    finally:
+        conn.close()
+
+
+def test_row_version_only_moves_when_rows_change(db, tmp_path):
+    path = str(tmp_path / "bps.db")
+    db.ensure_db(path)
+    conn = db._open(path)
+    try:
+        posts = _posts(3)
+        db.upsert_posts(conn, posts)
+        assert db._meta_get(conn, "row_version") == "1"
+
+        cursor = db.changes_since(conn, since=0)["cursor"]
+
+        db.upsert_posts(conn, posts)
+        db.upsert_posts(conn, [])
+        assert db._meta_get(conn, "row_version") == "1"
+        assert db.changes_since(conn, **cursor)["items"] == []
+
+        posts[1]["likes"] = 5
+        db.upsert_posts(conn, posts)
+        assert db._meta_get(conn, "row_version") == "2"
+        changed = db.changes_since(conn, **cursor)["items"]
+        assert [r["id"] for r in changed] == [1]
+    finally:
+        conn.close()